@@ -479,7 +479,9 @@ class Linter:
                         initial_linting_errors += linting_errors
 
                     if fix and fixes:
-                        linter_logger.info(f"Applying Fixes [{crawler.code}]: {fixes}")
+                        linter_logger.info(
+                            "Applying Fixes [%s]: %s", crawler.code, fixes
+                        )
                         # Do some sanity checks on the fixes before applying.
                         anchor_info = compute_anchor_edit_info(fixes)
                         if any(
@@ -1,7 +1,9 @@
 """Defines the templaters."""
 
 import logging
-from bisect import bisect_left
+import re
+from array import array
+from bisect import bisect_left, bisect_right
 from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 from sqlfluff.core.config import FluffConfig
@@ -11,17 +13,18 @@ from sqlfluff.core.helpers.slice import zero_slice
 # Instantiate the templater logger
 templater_logger = logging.getLogger("sqlfluff.templater")
 
+_newline_regex = re.compile("\n")
+
 
 def iter_indices_of_newlines(raw_str: str) -> Iterator[int]:
-    """Find the indices of all newlines in a string."""
-    init_idx = -1
-    while True:
-        nl_pos = raw_str.find("\n", init_idx + 1)
-        if nl_pos >= 0:
-            yield nl_pos
-            init_idx = nl_pos
-        else:
-            break  # pragma: no cover TODO?
+    """Find the indices of all newlines in a string.
+
+    NB: The scan and the extraction of positions both happen in C
+    (there is no python level loop per newline), which is
+    significantly faster than repeated `str.find()` calls for files
+    with many short lines.
+    """
+    return map(re.Match.start, _newline_regex.finditer(raw_str))
 
 
 def large_file_check(func):
@@ -119,6 +122,22 @@ class TemplatedFile:
     the capability to split up that file when lexing.
     """
 
+    # NB: One of these exists for every file linted, so we use slots
+    # to avoid the overhead of an instance dict on each of them.
+    __slots__ = (
+        "source_str",
+        "templated_str",
+        "fname",
+        "sliced_file",
+        "raw_sliced",
+        "_templated_slice_starts",
+        "_templated_slice_stops",
+        "_raw_slice_source_idxs",
+        "_raw_slice_nonliteral_counts",
+        "_cached_source_newlines",
+        "_cached_templated_newlines",
+    )
+
     def __init__(
         self,
         source_str: str,
@@ -147,6 +166,9 @@ class TemplatedFile:
         self.templated_str = source_str if templated_str is None else templated_str
         # If no fname, we assume this is from a string or stdin.
         self.fname = fname
+        # Newline positions are calculated lazily, see `_source_newlines`.
+        self._cached_source_newlines: Optional["array[int]"] = None
+        self._cached_templated_newlines: Optional["array[int]"] = None
         # Assume that no sliced_file, means the file is not templated
         self.sliced_file: List[TemplatedFileSlice]
         if sliced_file is None:
@@ -170,12 +192,15 @@ class TemplatedFile:
             assert raw_sliced is not None, "Templated file was sliced, but not raw."
             self.raw_sliced = raw_sliced
 
-        # Precalculate newlines, character positions.
-        self._source_newlines = list(iter_indices_of_newlines(self.source_str))
-        self._templated_newlines = list(iter_indices_of_newlines(self.templated_str))
-
-        # Consistency check raw string and slices.
+        # Consistency check raw string and slices. In the same pass we also
+        # collect the source position of each raw slice, and a running count
+        # of the non-literal slices before each one. Those let us answer
+        # `is_source_slice_literal()` by bisection rather than by scanning
+        # all the raw slices each time.
+        self._raw_slice_source_idxs: List[int] = []
+        self._raw_slice_nonliteral_counts: List[int] = [0]
         pos = 0
+        nonliteral_count = 0
         rfs: RawFileSlice
         for rfs in self.raw_sliced:
             assert rfs.source_idx == pos, (
@@ -183,12 +208,22 @@ class TemplatedFile:
                 f": {pos} != {rfs.source_idx}"
             )
             pos += len(rfs.raw)
+            self._raw_slice_source_idxs.append(rfs.source_idx)
+            if rfs.slice_type != "literal":
+                nonliteral_count += 1
+            self._raw_slice_nonliteral_counts.append(nonliteral_count)
         assert pos == len(self.source_str), (
             "TemplatedFile. Consistency fail on total source length"
             f": {pos} != {len(self.source_str)}"
         )
 
-        # Consistency check templated string and slices.
+        # Consistency check templated string and slices. In the same pass we
+        # also collect the templated boundaries of each slice. Having checked
+        # that the slices are contiguous, these are both sorted, which allows
+        # us to bisect them in `_find_slice_indices_of_templated_pos()` rather
+        # than scanning the whole sliced file for each lookup.
+        self._templated_slice_starts: List[int] = []
+        self._templated_slice_stops: List[int] = []
         previous_slice = None
         tfs: Optional[TemplatedFileSlice] = None
         for tfs in self.sliced_file:
@@ -209,6 +244,8 @@ class TemplatedFile:
                         "First Templated slice not started at index 0 "
                         f"(found slice {tfs.templated_slice})"
                     )
+            self._templated_slice_starts.append(tfs.templated_slice.start)
+            self._templated_slice_stops.append(tfs.templated_slice.stop)
             previous_slice = tfs
         if self.sliced_file and templated_str is not None:
             if tfs.templated_slice.stop != len(templated_str):
@@ -217,6 +254,34 @@ class TemplatedFile:
                     f"{len(templated_str)} != {tfs.templated_slice.stop}."
                 )
 
+    @property
+    def _source_newlines(self) -> "array[int]":
+        """The character positions of newlines in the source file.
+
+        These are stored as packed unsigned int arrays rather than lists
+        of boxed ints, which keeps the footprint small for large files
+        while still supporting bisection in `get_line_pos_of_char_pos()`.
+        They are calculated lazily, as not every file needs them.
+        """
+        if self._cached_source_newlines is None:
+            self._cached_source_newlines = array(
+                "I", iter_indices_of_newlines(self.source_str)
+            )
+        return self._cached_source_newlines
+
+    @property
+    def _templated_newlines(self) -> "array[int]":
+        """The character positions of newlines in the templated file."""
+        if self._cached_templated_newlines is None:
+            # For untemplated files, reuse the positions from the source.
+            if self.templated_str == self.source_str:
+                self._cached_templated_newlines = self._source_newlines
+            else:
+                self._cached_templated_newlines = array(
+                    "I", iter_indices_of_newlines(self.templated_str)
+                )
+        return self._cached_templated_newlines
+
     @classmethod
     def from_string(cls, raw: str) -> "TemplatedFile":
         """Create TemplatedFile from a string."""
@@ -269,26 +334,23 @@ class TemplatedFile:
         NB: the last_idx is exclusive, as the intent is to use this as a slice.
         """
         start_idx = start_idx or 0
-        first_idx = None
-        last_idx = start_idx
-        # Work through the sliced file, starting at the start_idx if given
-        # as an optimisation hint. The sliced_file is a list of TemplatedFileSlice
-        # which reference parts of the templated file and where they exist in the
-        # source.
-        for idx, elem in enumerate(self.sliced_file[start_idx:]):
-            last_idx = idx + start_idx
-            if elem[2].stop >= templated_pos:
-                if first_idx is None:
-                    first_idx = idx + start_idx
-                if elem[2].start > templated_pos:
-                    break
-                elif not inclusive and elem[2].start >= templated_pos:
-                    break
-        # If we got to the end add another index
-        else:
-            last_idx += 1
-        if first_idx is None:  # pragma: no cover
+        # The first slice which touches the point is the first one which
+        # stops at or after it. The sliced_file is a list of TemplatedFileSlice
+        # which reference parts of the templated file and where they exist in
+        # the source, and it's contiguous, so we can bisect.
+        first_idx = bisect_left(self._templated_slice_stops, templated_pos, start_idx)
+        if first_idx >= len(self._templated_slice_stops):  # pragma: no cover
             raise ValueError("Position Not Found")
+        # The last (exclusive) slice is the first one which starts after the
+        # point (or at it, if not inclusive).
+        if inclusive:
+            last_idx = bisect_right(
+                self._templated_slice_starts, templated_pos, first_idx
+            )
+        else:
+            last_idx = bisect_left(
+                self._templated_slice_starts, templated_pos, first_idx
+            )
         return first_idx, last_idx
 
     def raw_slices_spanning_source_slice(
@@ -299,24 +361,19 @@ class TemplatedFile:
         last_raw_slice = self.raw_sliced[-1]
         if source_slice.start >= last_raw_slice.source_idx + len(last_raw_slice.raw):
             return []
-        # First find the start index
-        raw_slice_idx = 0
-        # Move the raw pointer forward to the start of this patch
-        while (
-            raw_slice_idx + 1 < len(self.raw_sliced)
-            and self.raw_sliced[raw_slice_idx + 1].source_idx <= source_slice.start
-        ):
-            raw_slice_idx += 1
-        # Find slice index of the end of this patch.
-        slice_span = 1
-        while (
-            raw_slice_idx + slice_span < len(self.raw_sliced)
-            and self.raw_sliced[raw_slice_idx + slice_span].source_idx
-            < source_slice.stop
-        ):
-            slice_span += 1
+        # First find the start index, i.e. the last raw slice which starts
+        # at or before the start of this patch. NB: The source positions of
+        # the raw slices are sorted, so we can bisect them.
+        raw_slice_idx = max(
+            bisect_right(self._raw_slice_source_idxs, source_slice.start) - 1, 0
+        )
+        # Find slice index of the end of this patch. This always includes
+        # at least the starting slice.
+        stop_idx = bisect_left(
+            self._raw_slice_source_idxs, source_slice.stop, raw_slice_idx + 1
+        )
         # Return the raw slices:
-        return self.raw_sliced[raw_slice_idx : raw_slice_idx + slice_span]
+        return self.raw_sliced[raw_slice_idx:stop_idx]
 
     def templated_slice_to_source_slice(
         self,
@@ -442,20 +499,20 @@ class TemplatedFile:
         # Zero length slice. It's a literal, because it's definitely not templated.
         if source_slice.start == source_slice.stop:
             return True
-        is_literal = True
-        for raw_slice in self.raw_sliced:
-            # Reset if we find a literal and we're up to the start
-            # otherwise set false.
-            if raw_slice.source_idx <= source_slice.start:
-                is_literal = raw_slice.slice_type == "literal"
-            elif raw_slice.source_idx >= source_slice.stop:
-                # We've gone past the end. Break and Return.
-                break
-            else:
-                # We're in the middle. Check type
-                if raw_slice.slice_type != "literal":
-                    is_literal = False
-        return is_literal
+        # The slice starts within the last raw slice which starts at or before
+        # it. The literalness of that one sets our starting point.
+        start_idx = bisect_right(self._raw_slice_source_idxs, source_slice.start) - 1
+        is_literal = start_idx < 0 or self.raw_sliced[start_idx].slice_type == "literal"
+        # Any raw slices which start after that, but before the end of the
+        # slice, must all be literal too. The running count of non-literal
+        # slices tells us whether there are any in that range.
+        stop_idx = bisect_left(
+            self._raw_slice_source_idxs, source_slice.stop, start_idx + 1
+        )
+        return is_literal and (
+            self._raw_slice_nonliteral_counts[stop_idx]
+            == self._raw_slice_nonliteral_counts[start_idx + 1]
+        )
 
     def source_only_slices(self) -> List[RawFileSlice]:
         """Return a list a slices which reference the parts only in the source.
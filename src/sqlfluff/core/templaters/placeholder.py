@@ -1,6 +1,7 @@
 """Defines the placeholder template."""
 
 import logging
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 import regex
@@ -40,7 +41,7 @@ KNOWN_STYLES = {
         r"(?<![:\w\x5c])\${?(?P<param_name>[\w_]+)}?", regex.UNICODE
     ),
     # e.g. USE ${flyway:database}.schema_name;
-    "flyway_var": regex.compile(r"\${(?P<param_name>\w+[:\w_]+)}", regex.UNICODE),
+    "flyway_var": regex.compile(r"\$\{(?P<param_name>\w[:\w]*)\}", regex.UNICODE),
     # e.g. WHERE bla = ?
     "question_mark": regex.compile(r"(?<![:\w\x5c])\?", regex.UNICODE),
     # e.g. WHERE bla = $3 or WHERE bla = ${3}
@@ -54,6 +55,17 @@ KNOWN_STYLES = {
 }
 
 
+@lru_cache(maxsize=32)
+def _compile_param_regex(param_regex: str) -> "regex.Pattern[str]":
+    """Compile a custom param_regex.
+
+    The context (and so this regex) is fetched for every file processed,
+    but is usually the same for every file in a project, so we cache
+    the compiled pattern rather than compile it each time.
+    """
+    return regex.compile(param_regex)
+
+
 class PlaceholderTemplater(RawTemplater):
     """A templater for generic placeholders.
 
@@ -96,7 +108,7 @@ class PlaceholderTemplater(RawTemplater):
                 "Either param_style or param_regex must be provided, not both"
             )
         if "param_regex" in live_context:
-            live_context["__bind_param_regex"] = regex.compile(
+            live_context["__bind_param_regex"] = _compile_param_regex(
                 live_context["param_regex"]
             )
         elif "param_style" in live_context:
@@ -143,25 +155,30 @@ class PlaceholderTemplater(RawTemplater):
         template_slices = []
         raw_slices = []
         last_pos_raw, last_pos_templated = 0, 0
-        out_str = ""
+        # NB: Accumulate the output in a list and join at the end, rather
+        # than repeatedly extending (and reallocating) a string.
+        out_buff: List[str] = []
 
         regex = context["__bind_param_regex"]
         # when the param has no name, use a 1-based index
         param_counter = 1
         for found_param in regex.finditer(in_str):
             span = found_param.span()
-            if "param_name" not in found_param.groupdict():
+            # Fetch the named groups once per match, rather than separately
+            # for each of the lookups below.
+            param_groups = found_param.groupdict()
+            if "param_name" not in param_groups:
                 param_name = str(param_counter)
                 param_counter += 1
             else:
-                param_name = found_param["param_name"]
+                param_name = param_groups["param_name"]
             last_literal_length = span[0] - last_pos_raw
             if param_name in context:
                 replacement = str(context[param_name])
             else:
                 replacement = param_name
-            if "quotation" in found_param.groupdict():
-                quotation = found_param["quotation"]
+            if "quotation" in param_groups:
+                quotation = param_groups["quotation"]
                 replacement = quotation + replacement + quotation
             # add the literal to the slices
             template_slices.append(
@@ -181,7 +198,7 @@ class PlaceholderTemplater(RawTemplater):
                     source_idx=last_pos_raw,
                 )
             )
-            out_str += in_str[last_pos_raw : span[0]]
+            out_buff.append(in_str[last_pos_raw : span[0]])
             # add the current replaced element
             start_template_pos = last_pos_templated + last_literal_length
             template_slices.append(
@@ -198,7 +215,7 @@ class PlaceholderTemplater(RawTemplater):
                     source_idx=span[0],
                 )
             )
-            out_str += replacement
+            out_buff.append(replacement)
             # update the indexes
             last_pos_raw = span[1]
             last_pos_templated = start_template_pos + len(replacement)
@@ -221,13 +238,13 @@ class PlaceholderTemplater(RawTemplater):
                     source_idx=last_pos_raw,
                 )
             )
-            out_str += in_str[last_pos_raw:]
+            out_buff.append(in_str[last_pos_raw:])
         return (
             TemplatedFile(
                 # original string
                 source_str=in_str,
                 # string after all replacements
-                templated_str=out_str,
+                templated_str="".join(out_buff),
                 # filename
                 fname=fname,
                 # list of TemplatedFileSlice
@@ -288,6 +288,25 @@ class PythonTemplater(RawTemplater):
         # method more than once.
         templated_str = render_func(raw_str)
         templater_logger.debug("    Templated String: %r", templated_str)
+        # Short circuit: with no braces in the file there are no replacement
+        # fields, so the whole file is a single literal and we can skip the
+        # (relatively expensive) slicing algorithm below.
+        if (
+            raw_str
+            and templated_str == raw_str
+            and "{" not in raw_str
+            and "}" not in raw_str
+        ):
+            templater_logger.debug("    No replacement fields. Returning literal.")
+            return (
+                [RawFileSlice(raw_str, "literal", 0)],
+                [
+                    TemplatedFileSlice(
+                        "literal", slice(0, len(raw_str)), slice(0, len(raw_str))
+                    )
+                ],
+                templated_str,
+            )
         # Slice the raw file
         raw_sliced = list(self._slice_template(raw_str))
         templater_logger.debug("    Raw Sliced:")
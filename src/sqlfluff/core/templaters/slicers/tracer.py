@@ -44,6 +44,8 @@ class RawSliceInfo:
 class JinjaTracer:
     """Records execution path of a Jinja template."""
 
+    re_slice_id = regex.compile(r"^([0-9a-f]+)(_(\d+))?")
+
     def __init__(
         self,
         raw_str: str,
@@ -62,6 +64,13 @@ class JinjaTracer:
         # Internal bookkeeping
         self.program_counter: int = 0
         self.source_idx: int = 0
+        # Index the raw slices by their unique id, so that looking up each
+        # trace entry in `find_slice_index()` doesn't scan every raw slice.
+        self._slice_indices_by_id: Dict[Union[int, str, None], List[int]] = {}
+        for idx, rs in enumerate(raw_sliced):
+            self._slice_indices_by_id.setdefault(
+                raw_slice_info[rs].unique_alternate_id, []
+            ).append(idx)
 
     def trace(
         self,
@@ -78,37 +87,34 @@ class JinjaTracer:
         )
         trace_template_output = self.render_func(trace_template_str)
         # Split output by section. Each section has two possible formats.
-        trace_entries: List[regex.Match[str]] = list(
-            regex.finditer(r"\0", trace_template_output)
-        )
+        # NB: Anything before the first separator isn't a trace entry, so
+        # we discard it. This is a single linear pass without the regex
+        # engine.
+        trace_entries: List[str] = trace_template_output.split("\0")[1:]
         # If the file has no templated entries, we should just iterate
         # through the raw slices to add all the placeholders.
         if not trace_entries:
             for raw_idx, _ in enumerate(self.raw_sliced):
                 self.record_trace(0, raw_idx)
 
-        for match_idx, match in enumerate(trace_entries):
-            pos1 = match.span()[0]
-            try:
-                pos2 = trace_entries[match_idx + 1].span()[0]
-            except IndexError:
-                pos2 = len(trace_template_output)
-            p = trace_template_output[pos1 + 1 : pos2]
-            m_id = regex.match(r"^([0-9a-f]+)(_(\d+))?", p)
+        for p in trace_entries:
+            m_id = self.re_slice_id.match(p)
             if not m_id:
                 raise ValueError(  # pragma: no cover
                     "Internal error. Trace template output does not match expected "
                     "format."
                 )
-            if m_id.group(3):
+            alt_id, _, literal_length = m_id.groups()
+            if literal_length:
                 # E.g. "00000000000000000000000000000001_83". The number after
                 # "_" is the length (in characters) of a corresponding literal
                 # in raw_str.
-                alt_id, slice_length = m_id.group(1), int(m_id.group(3))
+                slice_length = int(literal_length)
             else:
                 # E.g. "00000000000000000000000000000002 a < 10". The characters
-                # after the slice ID are executable code from raw_str.
-                alt_id, slice_length = m_id.group(0), len(p[len(m_id.group(0)) + 1 :])
+                # after the slice ID are executable code from raw_str. NB: With
+                # no suffix, the whole match is just the slice ID.
+                slice_length = len(p[len(alt_id) + 1 :])
 
             target_slice_idx = self.find_slice_index(alt_id)
             target_inside_block = self.raw_slice_info[
@@ -136,11 +142,7 @@ class JinjaTracer:
 
         A slice identifier is a string like 00000000000000000000000000000002.
         """
-        raw_slices_search_result = [
-            idx
-            for idx, rs in enumerate(self.raw_sliced)
-            if self.raw_slice_info[rs].unique_alternate_id == slice_identifier
-        ]
+        raw_slices_search_result = self._slice_indices_by_id.get(slice_identifier, [])
         if len(raw_slices_search_result) != 1:
             raise ValueError(  # pragma: no cover
                 f"Internal error. Unable to locate slice for {slice_identifier}."
@@ -276,6 +278,7 @@ class JinjaAnalyzer:
 
     re_open_tag = regex.compile(r"^\s*({[{%])[\+\-]?\s*")
     re_close_tag = regex.compile(r"\s*[\+\-]?([}%]})\s*$")
+    re_strip_right = regex.compile(r"\s+$", regex.MULTILINE | regex.DOTALL)
 
     def __init__(self, raw_str: str, env: Environment) -> None:
         # Input
@@ -610,9 +613,7 @@ class JinjaAnalyzer:
                 )
                 if raw_slice_info_temp:
                     raw_slice_info = raw_slice_info_temp
-                m_strip_right = regex.search(
-                    r"\s+$", raw, regex.MULTILINE | regex.DOTALL
-                )
+                m_strip_right = self.re_strip_right.search(raw)
                 if block_type == "block_start":
                     block_idx += 1
                 if elem_type.endswith("_end") and raw.startswith("-") and m_strip_right:
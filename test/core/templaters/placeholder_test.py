@@ -329,6 +329,16 @@ def test__templater_raw():
             "SELECT metadata$filename, $1 FROM @stg_data_export_env_name;",
             {},
         ),
+        (
+            "SELECT ${a} FROM ${b}.${c};",
+            "flyway_var",
+            "SELECT col FROM db.tbl;",
+            {
+                "a": "col",
+                "b": "db",
+                "c": "tbl",
+            },
+        ),
     ],
     ids=[
         "no_changes",
@@ -350,6 +360,7 @@ def test__templater_raw():
         "flyway_var",
         "flyway_var",
         "params_not_specified",
+        "flyway_var_single_char",
     ],
 )
 def test__templater_param_style(instr, expected_outstr, param_style, values):